@@ -17,7 +17,7 @@ class TestEEGSignalIO(unittest.TestCase):
     def test_init(self):
         io_io_path = f'./tmp_out/{"".join(random.sample("zyxwvutsrqponmlkjihgfedcba", 20))}'
 
-        io_mode_space = ['pickle', 'lmdb']
+        io_mode_space = ['pickle', 'lmdb', 'memmap']
         for io_mode in io_mode_space:
             io = EEGSignalIO(io_path=io_io_path, io_mode=io_mode)
             self.assertEqual(len(io), 0)
@@ -29,7 +29,7 @@ class TestEEGSignalIO(unittest.TestCase):
     def test_write_eeg(self):
         io_io_path = f'./tmp_out/{"".join(random.sample("zyxwvutsrqponmlkjihgfedcba", 20))}'
 
-        io_mode_space = ['pickle', 'lmdb']
+        io_mode_space = ['pickle', 'lmdb', 'memmap']
         for io_mode in io_mode_space:
             io = EEGSignalIO(io_path=io_io_path, io_mode=io_mode)
 
@@ -42,7 +42,7 @@ class TestEEGSignalIO(unittest.TestCase):
     def test_len(self):
         io_io_path = f'./tmp_out/{"".join(random.sample("zyxwvutsrqponmlkjihgfedcba", 20))}'
 
-        io_mode_space = ['pickle', 'lmdb']
+        io_mode_space = ['pickle', 'lmdb', 'memmap']
         for io_mode in io_mode_space:
             io = EEGSignalIO(io_path=io_io_path, io_mode=io_mode)
 
@@ -57,7 +57,7 @@ class TestEEGSignalIO(unittest.TestCase):
     def test_read_eeg(self):
         io_io_path = f'./tmp_out/{"".join(random.sample("zyxwvutsrqponmlkjihgfedcba", 20))}'
 
-        io_mode_space = ['pickle', 'lmdb']
+        io_mode_space = ['pickle', 'lmdb', 'memmap']
         for io_mode in io_mode_space:
             io = EEGSignalIO(io_path=io_io_path, io_mode=io_mode)
 
@@ -67,10 +67,29 @@ class TestEEGSignalIO(unittest.TestCase):
             io_eeg = io.read_eeg(io_eeg_index)
             self.assertTrue(np.array_equal(eeg, io_eeg))
 
+    def test_read_eeg_batch(self):
+        io_io_path = f'./tmp_out/{"".join(random.sample("zyxwvutsrqponmlkjihgfedcba", 20))}'
+
+        io_mode_space = ['pickle', 'lmdb', 'memmap']
+        for io_mode in io_mode_space:
+            io = EEGSignalIO(io_path=io_io_path, io_mode=io_mode)
+
+            eeg_list = [np.random.randn(32, 128) for _ in range(4)]
+            io_eeg_indices = [io.write_eeg(eeg) for eeg in eeg_list]
+
+            io_eeg_list = io.read_eeg_batch(io_eeg_indices)
+            for eeg, io_eeg in zip(eeg_list, io_eeg_list):
+                self.assertTrue(np.array_equal(eeg, io_eeg))
+
+            # order follows the given keys
+            io_eeg_list = io.read_eeg_batch(io_eeg_indices[::-1])
+            for eeg, io_eeg in zip(eeg_list[::-1], io_eeg_list):
+                self.assertTrue(np.array_equal(eeg, io_eeg))
+
     def test_write_eeg_of_different_types(self):
         io_io_path = f'./tmp_out/{"".join(random.sample("zyxwvutsrqponmlkjihgfedcba", 20))}'
 
-        io_mode_space = ['pickle', 'lmdb']
+        io_mode_space = ['pickle', 'lmdb', 'memmap']
         for io_mode in io_mode_space:
             io = EEGSignalIO(io_path=io_io_path, io_mode=io_mode)
 
@@ -86,7 +105,7 @@ class TestEEGSignalIO(unittest.TestCase):
     def test_write_eeg_of_different_shapes(self):
         io_io_path = f'./tmp_out/{"".join(random.sample("zyxwvutsrqponmlkjihgfedcba", 20))}'
 
-        io_mode_space = ['pickle', 'lmdb']
+        io_mode_space = ['pickle', 'lmdb', 'memmap']
         for io_mode in io_mode_space:
             io = EEGSignalIO(io_path=io_io_path, io_mode=io_mode)
 
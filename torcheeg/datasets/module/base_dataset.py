@@ -1,7 +1,8 @@
 import logging
 import os
 import shutil
-from typing import Any, Callable, Dict, Union
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Tuple, Union
 import torch
 import numpy as np
 import pandas as pd
@@ -241,6 +242,10 @@ class BaseDataset(Dataset):
         if file_id == 0:
             pbar.close()
 
+        # make sure buffered state of the storage back end is on disk
+        # before the record is reported as cached
+        eeg_io.flush()
+
         return {
             'eeg_io': eeg_io,
             'info_io': info_io,
@@ -340,9 +345,13 @@ class BaseDataset(Dataset):
                 session_samples = []
                 for _, trial_info in trial_df:
                     trial_samples = []
-                    for i in range(len(trial_info)):
-                        eeg_index = str(trial_info.iloc[i]['clip_id'])
-                        eeg_record = str(trial_info.iloc[i]['_record_id'])
+                    # a contiguous structured array avoids the pandas
+                    # block-manager overhead of .iloc row access per sample
+                    trial_records = trial_info[['clip_id', '_record_id'
+                                                ]].to_records(index=False)
+                    for clip_id, record_id in trial_records:
+                        eeg_index = str(clip_id)
+                        eeg_record = str(record_id)
 
                         subject_record_list.append(eeg_record)
                         subject_index_list.append(eeg_index)
@@ -370,6 +379,10 @@ class BaseDataset(Dataset):
 
                 self.write_eeg(eeg_record, eeg_index, eeg)
 
+        # persist whatever the storage back ends buffered during the hooks
+        for eeg_io in self.eeg_io_router.values():
+            eeg_io.flush()
+
         pbar.close()
 
     @staticmethod
@@ -408,6 +421,32 @@ class BaseDataset(Dataset):
         eeg_io = self.eeg_io_router[record]
         return eeg_io.read_eeg(key)
 
+    def read_eeg_batch(self, records: List[str], keys: List[str]) -> List:
+        r'''
+        Query a batch of EEG signals in the EEGSignalIO according to the given :obj:`keys`. The queries are grouped by record so that each EEGSignalIO is visited once per batch instead of once per sample.
+
+        Args:
+            records (list): The record ids of the EEG signals to be queried.
+            keys (list): The indices of the EEG signals to be queried.
+
+        Returns:
+            list: The EEG signal samples, in the order of the given keys.
+        '''
+        eegs = [None] * len(keys)
+
+        record_to_positions = defaultdict(list)
+        for position, record in enumerate(records):
+            record_to_positions[record].append(position)
+
+        for record, positions in record_to_positions.items():
+            eeg_io = self.eeg_io_router[record]
+            batch = eeg_io.read_eeg_batch(
+                [keys[position] for position in positions])
+            for position, eeg in zip(positions, batch):
+                eegs[position] = eeg
+
+        return eegs
+
     def write_eeg(self, record: str, key: str, eeg: Any):
         r'''
         Update the corresponding EEG signal in the EEGSignalIO according to the the given :obj:`key`.
@@ -420,19 +459,53 @@ class BaseDataset(Dataset):
         eeg_io = self.eeg_io_router[record]
         eeg_io.write_eeg(eeg=eeg, key=key)
 
+    @property
+    def info(self) -> pd.DataFrame:
+        return self._info
+
+    @info.setter
+    def info(self, info: pd.DataFrame):
+        self._info = info
+        # invalidate the per-sample caches derived from the meta information
+        self._info_records = None
+        self._sample_keys = None
+
     def read_info(self, index: int) -> Dict:
         r'''
         Query the corresponding meta information in the MetaInfoIO according to the the given :obj:`index`.
 
         In meta infomation, clip_id is required. Specifies the corresponding key of EEG in EEGSginalIO, which can be used to index EEG samples based on :obj:`self.read_eeg(key)`.
 
+        To avoid the pandas row-indexing overhead of :obj:`self.info.iloc[index].to_dict()` on every sample access, the meta information is converted to a list of dictionaries once and cached. The cache is rebuilt whenever :obj:`self.info` is reassigned (e.g., by the dataset splitting strategies in :obj:`torcheeg.model_selection`), and each call returns a fresh shallow copy so that mutating the result cannot corrupt the cache.
+
         Args:
             index (int): The index of the meta information to be queried.
-            
+
         Returns:
             dict: The meta information.
         '''
-        return self.info.iloc[index].to_dict()
+        if self._info_records is None:
+            self._info_records = self.info.to_dict('records')
+        return dict(self._info_records[index])
+
+    def sample_keys(self, index: int) -> Tuple[str, ...]:
+        r'''
+        Query the string keys locating the EEG signal of the sample at the given :obj:`index` in the IO, i.e., the (record id, clip id) pair. The keys of all samples are built once and cached so that :obj:`__getitem__` avoids the per-sample dictionary lookups and :obj:`str` casts; like the cached info records, the cache is invalidated when :obj:`self.info` is reassigned.
+
+        Args:
+            index (int): The index of the sample to be queried.
+
+        Returns:
+            tuple: The string keys locating the EEG signal in the IO.
+        '''
+        if self._sample_keys is None:
+            self._sample_keys = self.build_sample_keys()
+        return self._sample_keys[index]
+
+    def build_sample_keys(self) -> List[Tuple[str, ...]]:
+        return list(
+            zip(map(str, self.info['_record_id']),
+                map(str, self.info['clip_id'])))
 
     def exist(self, io_path: str) -> bool:
         '''
@@ -449,12 +522,17 @@ class BaseDataset(Dataset):
     def __getitem__(self, index: int) -> any:
         info = self.read_info(index)
 
-        eeg_index = str(info['clip_id'])
-        eeg_record = str(info['_record_id'])
+        eeg_record, eeg_index = self.sample_keys(index)
         eeg = self.read_eeg(eeg_record, eeg_index)
 
         return eeg, info
 
+    def __getitems__(self, indices: List[int]) -> List:
+        r'''
+        Fetch a batch of samples at once. :obj:`torch.utils.data.DataLoader` uses this method automatically when it is present. The base implementation delegates to :obj:`__getitem__` sample by sample, so subclasses that only override :obj:`__getitem__` (e.g., to apply transforms) keep their behavior; subclasses whose :obj:`__getitem__` this method faithfully mirrors can override it to read the EEG signals of the whole batch through :obj:`read_eeg_batch` in grouped queries, as :obj:`AMIGOSDataset` does.
+        '''
+        return [self[index] for index in indices]
+
     def get_labels(self) -> list:
         '''
         Get the labels of the dataset.
@@ -3,6 +3,7 @@ import os
 import re
 from typing import Any, Callable, Dict, List, Tuple, Union
 
+import numpy as np
 import scipy.io as scio
 
 from ..base_dataset import BaseDataset
@@ -113,8 +114,8 @@ class AMIGOSDataset(BaseDataset):
         after_trial (Callable, optional): The hook performed on the trial to which the sample belongs. It is performed after the offline transformation and thus typically used to implement context-dependent sample transformations, such as moving averages, etc. The input and output of this hook function should be a sequence of dictionaries representing a sequence of EEG samples. Each dictionary contains two key-value pairs, indexed by :obj:`eeg` (the EEG signal matrix) and :obj:`key` (the index in the database) respectively.
         io_path (str): The path to generated unified data IO, cached as an intermediate result. If set to None, a random path will be generated. (default: :obj:`None`)
         io_size (int): Maximum size database may grow to; used to size the memory mapping. If database grows larger than ``map_size``, an exception will be raised and the user must close and reopen. (default: :obj:`1048576`)
-        io_mode (str): Storage mode of EEG signal. When io_mode is set to :obj:`lmdb`, TorchEEG provides an efficient database (LMDB) for storing EEG signals. LMDB may not perform well on limited operating systems, where a file system based EEG signal storage is also provided. When io_mode is set to :obj:`pickle`, pickle-based persistence files are used. When io_mode is set to :obj:`memory`, memory are used. (default: :obj:`lmdb`)
-        num_worker (int): Number of subprocesses to use for data loading. 0 means that the data will be loaded in the main process. (default: :obj:`0`)
+        io_mode (str): Storage mode of EEG signal. When io_mode is set to :obj:`lmdb`, TorchEEG provides an efficient database (LMDB) for storing EEG signals. LMDB may not perform well on limited operating systems, where a file system based EEG signal storage is also provided. When io_mode is set to :obj:`pickle`, pickle-based persistence files are used. When io_mode is set to :obj:`memory`, memory are used. When io_mode is set to :obj:`memmap`, the preprocessed chunks are concatenated into a single binary file and read back as zero-copy memory-mapped views, which avoids the deserialization cost of the other persistent back ends during training; it requires the (optionally transformed) samples to be :obj:`np.ndarray`. (default: :obj:`lmdb`)
+        num_worker (int): Number of subprocesses to use for data loading. 0 means that the data will be loaded in the main process. Preprocessing is dominated by the single-threaded :obj:`scipy.io.loadmat` call per subject file, so setting this to the number of available cores processes the :obj:`Data_Preprocessed_PXX.mat` files in parallel worker processes and speeds up the one-off cache generation accordingly. (default: :obj:`0`)
         verbose (bool): Whether to display logs during processing, such as progress bars, etc. (default: :obj:`True`)
     '''
 
@@ -252,13 +253,28 @@ class AMIGOSDataset(BaseDataset):
             else:
                 dynamic_chunk_size = chunk_size
 
-            # chunk with chunk size
-            end_at = start_at + dynamic_chunk_size
+            if dynamic_chunk_size <= 0 or trial_samples.shape[
+                    1] - start_at < dynamic_chunk_size:
+                continue
+
             # calculate moving step
             step = dynamic_chunk_size - overlap
-
-            while end_at <= trial_samples.shape[1]:
-                clip_sample = trial_samples[:num_channel, start_at:end_at]
+            if step <= 0:
+                raise ValueError(
+                    f'overlap ({overlap}) must be smaller than chunk_size ({dynamic_chunk_size}), otherwise the chunking window cannot move forward.'
+                )
+
+            # materialize all windows of the trial as a single zero-copy
+            # stride view instead of slicing window by window
+            windows = np.lib.stride_tricks.sliding_window_view(
+                trial_samples[:num_channel, start_at:],
+                dynamic_chunk_size,
+                axis=1)[:, ::step]
+
+            for window_id in range(windows.shape[1]):
+                clip_sample = windows[:, window_id]
+                clip_start_at = start_at + window_id * step
+                clip_end_at = clip_start_at + dynamic_chunk_size
 
                 t_eeg = clip_sample
                 t_baseline = trial_baseline_sample
@@ -280,30 +296,31 @@ class AMIGOSDataset(BaseDataset):
 
                 # record meta info for each signal
                 record_info = {
-                    'start_at': start_at,
-                    'end_at': end_at,
+                    'start_at': clip_start_at,
+                    'end_at': clip_end_at,
                     'clip_id': clip_id
                 }
                 record_info.update(trial_meta_info)
                 yield {'eeg': t_eeg, 'key': clip_id, 'info': record_info}
 
-                start_at = start_at + step
-                end_at = start_at + dynamic_chunk_size
-
     def set_records(self, root_path: str = './data_preprocessed', **kwargs):
         assert os.path.exists(
             root_path
         ), f'root_path ({root_path}) does not exist. Please download the dataset and set the root_path to the downloaded path.'
         return os.listdir(root_path)
 
+    def build_sample_keys(self) -> List[Tuple[str, str, str]]:
+        # also cache the key of the baseline signal read by __getitem__
+        return list(
+            zip(map(str, self.info['_record_id']),
+                map(str, self.info['clip_id']),
+                map(str, self.info['baseline_id'])))
+
     def __getitem__(self, index: int) -> Tuple[any, any, int, int, int]:
         info = self.read_info(index)
 
-        eeg_index = str(info['clip_id'])
-        eeg_record = str(info['_record_id'])
+        eeg_record, eeg_index, baseline_index = self.sample_keys(index)
         eeg = self.read_eeg(eeg_record, eeg_index)
-
-        baseline_index = str(info['baseline_id'])
         baseline = self.read_eeg(eeg_record, baseline_index)
 
         signal = eeg
@@ -317,6 +334,30 @@ class AMIGOSDataset(BaseDataset):
 
         return signal, label
 
+    def __getitems__(self, indices: List[int]) -> List[Tuple[any, any]]:
+        infos = [self.read_info(index) for index in indices]
+        keys = [self.sample_keys(index) for index in indices]
+
+        records = [key[0] for key in keys]
+        eegs = self.read_eeg_batch(records, [key[1] for key in keys])
+        baselines = self.read_eeg_batch(records, [key[2] for key in keys])
+
+        batch = []
+        for info, eeg, baseline in zip(infos, eegs, baselines):
+            signal = eeg
+            label = info
+
+            if self.online_transform:
+                signal = self.online_transform(eeg=eeg,
+                                               baseline=baseline)['eeg']
+
+            if self.label_transform:
+                label = self.label_transform(y=info)['y']
+
+            batch.append((signal, label))
+
+        return batch
+
     @property
     def repr_body(self) -> Dict:
         return dict(
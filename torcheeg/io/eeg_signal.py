@@ -1,7 +1,8 @@
 import pickle
 import os
-from typing import Union
+from typing import List, Union
 
+import numpy as np
 import torch
 import lmdb
 
@@ -21,6 +22,13 @@ class _EEGSignalIO:
     def read_eeg(self, key: str) -> any:
         raise NotImplementedError
 
+    def read_eeg_batch(self, keys: List[str]) -> list:
+        return [self.read_eeg(key) for key in keys]
+
+    def flush(self):
+        # back ends that write through on every write_eeg need no flush
+        pass
+
     def write_eeg(self,
                   eeg: Union[any, torch.Tensor],
                   key: Union[str, None] = None) -> str:
@@ -159,6 +167,26 @@ class LMDBEEGSignalIO(_EEGSignalIO):
 
         return pickle.loads(eeg)
 
+    def read_eeg_batch(self, keys: List[str]) -> list:
+        r'''
+        Query a batch of EEG signals in the database within a single read transaction, which is substantially faster than opening one transaction per key.
+
+        Args:
+            keys (list): The indices of the EEG signals to be queried.
+
+        Returns:
+            list: The EEG signal samples, in the order of the given keys.
+        '''
+        with self._env.begin(write=False) as transaction:
+            eegs = [transaction.get(key.encode()) for key in keys]
+
+        for key, eeg in zip(keys, eegs):
+            if eeg is None:
+                raise RuntimeError(
+                    f'Unable to index the EEG signal sample with key {key}!')
+
+        return [pickle.loads(eeg) for eeg in eegs]
+
     def keys(self):
         r'''
         Get all keys in the LMDBEEGSignalIO.
@@ -283,6 +311,142 @@ class PickleEEGSignalIO(_EEGSignalIO):
         return result
 
 
+class MemmapEEGSignalIO(_EEGSignalIO):
+    r'''
+    A storage back end that concatenates all EEG signals into a single binary file and reads them back through :obj:`np.memmap`. Unlike the pickle-based back ends, reading a sample returns a zero-copy view into the page cache instead of deserializing a buffer, which makes read-heavy training loops bandwidth-bound rather than copy-bound. Only :obj:`np.ndarray` samples are supported; the returned views are read-only.
+    '''
+
+    def __init__(self, io_path: str) -> None:
+        self.io_path = io_path
+
+        os.makedirs(self.io_path, exist_ok=True)
+
+        self.data_path = os.path.join(self.io_path, 'eeg.dat')
+        self.index_path = os.path.join(self.io_path, 'index.pkl')
+
+        if os.path.exists(self.index_path):
+            with open(self.index_path, 'rb') as f:
+                self._index = pickle.load(f)
+        else:
+            if os.path.exists(self.data_path) and os.path.getsize(
+                    self.data_path) > 0:
+                raise RuntimeError(
+                    f'Found EEG data at {self.data_path} but no key index at {self.index_path}. The cache is corrupt, e.g., the process was killed before the index was flushed. Please delete the folder {self.io_path} and regenerate the database.'
+                )
+            self._index = {}
+
+        self._index_dirty = False
+        self._mmap = None
+
+    def __len__(self):
+        return len(self._index)
+
+    def write_eeg(self,
+                  eeg: Union[any, torch.Tensor],
+                  key: Union[str, None] = None) -> str:
+        r'''
+        Write EEG signal to the binary file. The signal is appended to the data file and its offset, shape and dtype are recorded in the index; rewriting an existing key appends the new data and repoints the index entry.
+
+        Args:
+            eeg (np.ndarray): EEG signal samples to be written into the data file.
+            key (str, optional): The key of the EEG signal to be inserted, if not specified, it will be an auto-incrementing integer.
+
+        Returns:
+            int: The index of written EEG signals in the data file.
+        '''
+        if key is None:
+            key = str(self.write_pointer)
+
+        if eeg is None:
+            raise RuntimeError(f'Save None to the memmap with the key {key}!')
+
+        eeg = np.ascontiguousarray(eeg)
+
+        with open(self.data_path, 'ab') as f:
+            offset = f.tell()
+            f.write(eeg.tobytes())
+
+        self._index[key] = (offset, eeg.shape, eeg.dtype.str)
+        # persisting the whole index per write would be quadratic in the
+        # number of samples; it is flushed once in 'flush' instead
+        self._index_dirty = True
+
+        # the data file has grown, remap on the next read
+        self._mmap = None
+
+        return key
+
+    def flush(self):
+        r'''
+        Persist the in-memory key index to disk. Called from :obj:`BaseDataset.save_record` and the post-processing hooks once a batch of writes is complete (and from :obj:`__getstate__`/:obj:`__del__` as backstops), so the index is re-serialized once instead of once per sample.
+        '''
+        if self._index_dirty:
+            with open(self.index_path, 'wb') as f:
+                pickle.dump(self._index, f)
+            self._index_dirty = False
+
+    def __del__(self):
+        self.flush()
+
+    def read_eeg(self, key: str) -> any:
+        r'''
+        Query the corresponding EEG signal in the data file according to the index. The sample is returned as a read-only, zero-copy view of the memory-mapped data file.
+
+        Args:
+            key (str): The index of the EEG signal to be queried.
+
+        Returns:
+            np.ndarray: The EEG signal sample.
+        '''
+        if key not in self._index:
+            raise RuntimeError(
+                f'Unable to index the EEG signal sample with key {key}!')
+
+        offset, shape, dtype = self._index[key]
+
+        if self._mmap is None:
+            self._mmap = np.memmap(self.data_path, dtype=np.uint8, mode='r')
+
+        num_bytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        return self._mmap[offset:offset + num_bytes].view(dtype).reshape(shape)
+
+    def keys(self):
+        r'''
+        Get all keys in the MemmapEEGSignalIO.
+
+        Returns:
+            list: The list of keys in the MemmapEEGSignalIO.
+        '''
+        return list(self._index.keys())
+
+    def eegs(self):
+        r'''
+        Get all EEG signals in the MemmapEEGSignalIO.
+
+        Returns:
+            list: The list of EEG signals in the MemmapEEGSignalIO.
+        '''
+        return [self.read_eeg(key) for key in self.keys()]
+
+    def __getstate__(self):
+        # pickle for Pallarel; flush so the unpickled side and any other
+        # process reading the io_path see the complete index
+        self.flush()
+        state = self.__dict__.copy()
+        state['_mmap'] = None
+        return state
+
+    def __copy__(self):
+        cls = self.__class__
+        result = cls.__new__(cls)
+        result.__dict__.update({
+            k: v
+            for k, v in self.__dict__.items() if k != '_mmap'
+        })
+        result._mmap = None
+        return result
+
+
 class EEGSignalIO:
     r'''
     A general-purpose, lightweight and efficient EEG signal IO APIs for converting various real-world EEG signal datasets into samples and storing them in the database. Here, we draw on the implementation ideas of industrial-grade application Caffe, and encapsulate a set of EEG signal reading and writing methods based on Lightning Memory-Mapped Database (LMDB), which not only unifies the differences of data types in different databases, but also accelerates the reading of data during training and testing.
@@ -298,7 +462,7 @@ class EEGSignalIO:
     Args:
         io_path (str): Where the database is stored.
         io_size (int, optional): The maximum capacity of the database. It will increase according to the size of the dataset. (default: :obj:`1024`)
-        io_mode (str): Storage mode of EEG signal. When io_mode is set to :obj:`lmdb`, TorchEEG provides an efficient database (LMDB) for storing EEG signals. LMDB may not perform well on limited operating systems. Here, a file system based and a memory based EEG signal storages are also provided. When io_mode is set to :obj:`pickle`, pickle-based persistence files are used. When io_mode is set to :obj:`memory`, memory are used. (default: :obj:`lmdb`)
+        io_mode (str): Storage mode of EEG signal. When io_mode is set to :obj:`lmdb`, TorchEEG provides an efficient database (LMDB) for storing EEG signals. LMDB may not perform well on limited operating systems. Here, a file system based and a memory based EEG signal storages are also provided. When io_mode is set to :obj:`pickle`, pickle-based persistence files are used. When io_mode is set to :obj:`memory`, memory are used. When io_mode is set to :obj:`memmap`, samples are concatenated into a single binary file and read back as zero-copy memory-mapped views, which is the fastest option for read-heavy training loops but only supports :obj:`np.ndarray` samples. (default: :obj:`lmdb`)
     '''
 
     def __init__(self,
@@ -316,9 +480,11 @@ class EEGSignalIO:
             self._io = PickleEEGSignalIO(io_path=self.io_path)
         elif self.io_mode == 'memory':
             self._io = MemoryEEGSignalIO()
+        elif self.io_mode == 'memmap':
+            self._io = MemmapEEGSignalIO(io_path=self.io_path)
         else:
             raise RuntimeError(
-                f'Unsupported io_mode {self.io_mode}, please choose from lmdb, pickle and memory.'
+                f'Unsupported io_mode {self.io_mode}, please choose from lmdb, pickle, memory and memmap.'
             )
 
     def __del__(self):
@@ -365,6 +531,24 @@ class EEGSignalIO:
         '''
         return self._io.read_eeg(key)
 
+    def read_eeg_batch(self, keys: List[str]) -> list:
+        r'''
+        Query a batch of EEG signals in the database according to their indices, using a single grouped query where the underlying storage supports it.
+
+        Args:
+            keys (list): The indices of the EEG signals to be queried.
+
+        Returns:
+            list: The EEG signal samples, in the order of the given keys.
+        '''
+        return self._io.read_eeg_batch(keys)
+
+    def flush(self):
+        r'''
+        Persist any state the underlying storage buffers in memory to disk. A no-op for back ends that write through on every :obj:`write_eeg`.
+        '''
+        self._io.flush()
+
     def keys(self):
         r'''
         Get all keys in the EEGSignalIO.
@@ -412,6 +596,20 @@ class EEGSignalIO:
 
         self._io = _io
 
+    def to_memmap(self, io_path: str):
+        r'''
+        Convert to the MemmapEEGSignalIO, where the index of each sample in the data file corresponds to the key, and the EEG signal stored in the data file corresponds to the value.
+        '''
+        _io = MemmapEEGSignalIO(io_path=io_path)
+
+        self.io_path = io_path
+        self.io_mode = 'memmap'
+
+        for key in self.keys():
+            _io.write_eeg(self.read_eeg(key=key), key=key)
+
+        self._io = _io
+
     def to_memory(self):
         r'''
         Convert to the MemoryEEGSignalIO, where the index of each sample in the database corresponds to the key, and the EEG signal stored in the database corresponds to the value.
@@ -120,6 +120,9 @@ class ClassifierTrainer(pl.LightningModule):
             train_loader (DataLoader): Iterable DataLoader for traversing the training data batch (:obj:`torch.utils.data.dataloader.DataLoader`, :obj:`torch_geometric.loader.DataLoader`, etc).
             val_loader (DataLoader): Iterable DataLoader for traversing the validation data batch (:obj:`torch.utils.data.dataloader.DataLoader`, :obj:`torch_geometric.loader.DataLoader`, etc).
             max_epochs (int): Maximum number of epochs to train the model. (default: :obj:`300`)
+
+        .. note::
+            When training on GPU, construct the dataloaders with :obj:`pin_memory=True`: batches in pinned memory are moved to the device with :obj:`non_blocking=True`, so the host-to-device copy overlaps with the compute of the previous step instead of blocking on PCIe.
         '''
         trainer = pl.Trainer(devices=self.devices,
                              accelerator=self.accelerator,
@@ -133,6 +136,9 @@ class ClassifierTrainer(pl.LightningModule):
         r'''
         Args:
             test_loader (DataLoader): Iterable DataLoader for traversing the test data batch (torch.utils.data.dataloader.DataLoader, torch_geometric.loader.DataLoader, etc).
+
+        .. note::
+            As with :obj:`fit`, pass :obj:`pin_memory=True` to the dataloader when evaluating on GPU so batch transfers are issued asynchronously.
         '''
         trainer = pl.Trainer(devices=self.devices,
                              accelerator=self.accelerator,
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Union
 
 import torch.nn as nn
 
@@ -60,6 +60,7 @@ class DANNTrainer(_DANNLikeTrainer):
         devices (int): The number of devices to use. (default: :obj:`1`)
         accelerator (str): The accelerator to use. Available options are: 'cpu', 'gpu'. (default: :obj:`"cpu"`)
         metrics (list of str): The metrics to use. Available options are: 'precision', 'recall', 'f1score', 'accuracy', 'matthews', 'auroc', and 'kappa'. (default: :obj:`["accuracy"]`)
+        compile_mode (str, optional): If set, the extractor, classifier and domain classifier are optimized with :obj:`torch.compile` (requires torch >= 2.0) using the given mode, e.g. :obj:`'default'` or :obj:`'reduce-overhead'`, which fuses elementwise kernels and specializes on the batch shape. Construct the dataloaders with :obj:`drop_last=True` so that batch shapes stay static and do not trigger recompilation. (default: :obj:`None`)
 
     .. automethod:: fit
     .. automethod:: test
@@ -78,7 +79,8 @@ class DANNTrainer(_DANNLikeTrainer):
                  warmup_epochs: int = 0,
                  devices: int = 1,
                  accelerator: str = "cpu",
-                 metrics: List[str] = ["accuracy"]):
+                 metrics: List[str] = ["accuracy"],
+                 compile_mode: Union[None, str] = None):
 
         super(DANNTrainer, self).__init__(extractor=extractor,
                                           classifier=classifier,
@@ -93,4 +95,5 @@ class DANNTrainer(_DANNLikeTrainer):
                                           warmup_epochs=warmup_epochs,
                                           devices=devices,
                                           accelerator=accelerator,
-                                          metrics=metrics)
+                                          metrics=metrics,
+                                          compile_mode=compile_mode)
@@ -1,6 +1,6 @@
 import logging
 from itertools import chain
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
 import numpy as np
 import pytorch_lightning as pl
@@ -16,6 +16,9 @@ log = logging.getLogger('torcheeg')
 
 
 class DualDataLoader:
+    r'''
+    Pairs every batch of :obj:`ref_dataloader` with a batch of :obj:`other_dataloader`. When the other dataloader is exhausted it is simply re-iterated, so unlike :obj:`itertools.cycle` no yielded batch is ever kept around for replay and the extra memory cost stays O(1) regardless of the dataset size.
+    '''
     def __init__(self, ref_dataloader: DataLoader,
                  other_dataloader: DataLoader):
         self.ref_dataloader = ref_dataloader
@@ -41,13 +44,14 @@ class DualDataLoader:
 class GradientReverse(Function):
     @staticmethod
     def forward(ctx, x, alpha):
-        ctx.alpha = alpha
-        return x.view_as(x)
+        ctx.neg_alpha = -float(alpha)
+        return x
 
     @staticmethod
     def backward(ctx, grad_output):
-        output = grad_output.neg() * ctx.alpha
-        return output, None
+        # single scalar-multiply kernel instead of a neg() temporary
+        # followed by a multiply
+        return grad_output * ctx.neg_alpha, None
 
 
 class _DANNLikeTrainer(ClassifierTrainer):
@@ -65,12 +69,23 @@ class _DANNLikeTrainer(ClassifierTrainer):
                  warmup_epochs: int = 0,
                  devices: int = 1,
                  accelerator: str = "cpu",
-                 metrics: List[str] = ["accuracy"]):
+                 metrics: List[str] = ["accuracy"],
+                 compile_mode: Union[None, str] = None):
         super(ClassifierTrainer, self).__init__()
 
         self.extractor = extractor
         self.classifier = classifier
         self.domain_classifier = domain_classifier
+        self.compile_mode = compile_mode
+
+        if compile_mode is not None:
+            # requires torch >= 2.0; keep batch shapes static (e.g.,
+            # drop_last=True dataloaders) to avoid recompilation
+            self.extractor = torch.compile(self.extractor, mode=compile_mode)
+            self.classifier = torch.compile(self.classifier,
+                                            mode=compile_mode)
+            self.domain_classifier = torch.compile(self.domain_classifier,
+                                                   mode=compile_mode)
 
         self.lr = lr
         self.weight_decay = weight_decay
@@ -90,15 +105,25 @@ class _DANNLikeTrainer(ClassifierTrainer):
         self.init_metrics(metrics, num_classes)
 
         self.ce_fn = nn.CrossEntropyLoss()
+        self.domain_ce_fn = nn.CrossEntropyLoss(reduction='none')
 
         self.num_batches = None  # init in 'fit' method
         self.non_warmup_epochs = None  # init in 'fit' method
         self.lr_factor = 1.0  # update in 'on_train_batch_start' method
         self.scheduled_alpha = 1.0  # update in 'on_train_batch_start' method
+        self._alpha_schedule = None  # precomputed in 'fit' method
+
+        # cached domain labels, grown on demand in 'training_step'
+        self._source_domain_labels = None
+        self._target_domain_labels = None
 
     def init_metrics(self, metrics: List[str], num_classes: int) -> None:
-        self.train_domain_loss = torchmetrics.MeanMetric()
-        self.train_task_loss = torchmetrics.MeanMetric()
+        # the training losses only need a running mean, so they are
+        # tracked with plain on-device accumulators; torchmetrics is kept
+        # for val/test and for the configurable classification metrics
+        self._train_domain_loss_sum = None
+        self._train_task_loss_sum = None
+        self._train_loss_count = 0
 
         self.val_loss = torchmetrics.MeanMetric()
         self.test_loss = torchmetrics.MeanMetric()
@@ -120,6 +145,12 @@ class _DANNLikeTrainer(ClassifierTrainer):
             target_loader (DataLoader): Iterable DataLoader for traversing the training data batch from the target domain (:obj:`torch.utils.data.dataloader.DataLoader`, :obj:`torch_geometric.loader.DataLoader`, etc). The target dataset does not have to return labels.
             val_loader (DataLoader): Iterable DataLoader for traversing the validation data batch (:obj:`torch.utils.data.dataloader.DataLoader`, :obj:`torch_geometric.loader.DataLoader`, etc).
             max_epochs (int): The maximum number of epochs to train. (default: :obj:`300`)
+
+        .. note::
+            When training on GPU, construct the dataloaders with :obj:`pin_memory=True` so that the host-to-device copy of each batch is issued asynchronously (:obj:`non_blocking`) and overlaps with the compute of the previous step.
+
+        .. note::
+            Additional arguments are forwarded to :obj:`pytorch_lightning.Trainer`. In particular, passing :obj:`precision='16-mixed'` runs the extractor, classifier and domain classifier forwards and the losses under mixed-precision autocast with gradient scaling, which roughly halves activation memory and typically yields 1.5-2x step throughput on recent GPUs.
         '''
 
         train_loader = DualDataLoader(source_loader, target_loader)
@@ -127,6 +158,13 @@ class _DANNLikeTrainer(ClassifierTrainer):
         self.num_batches = len(train_loader)
         self.non_warmup_epochs = max_epochs - self.warmup_epochs
 
+        if self.alpha_scheduler:
+            # precompute the whole alpha schedule once instead of
+            # evaluating np.exp on every batch
+            num_steps = max(self.non_warmup_epochs * self.num_batches, 1)
+            p = np.arange(num_steps) / num_steps
+            self._alpha_schedule = 2.0 / (1.0 + np.exp(-10 * p)) - 1
+
         trainer = pl.Trainer(devices=self.devices,
                              accelerator=self.accelerator,
                              max_epochs=max_epochs,
@@ -137,16 +175,43 @@ class _DANNLikeTrainer(ClassifierTrainer):
     def on_train_batch_start(self, batch, batch_idx):
         if self.current_epoch >= self.warmup_epochs:
             delta_epoch = self.current_epoch - self.warmup_epochs
-            p = (batch_idx + delta_epoch * self.num_batches) / (
-                self.non_warmup_epochs * self.num_batches)
+            step = batch_idx + delta_epoch * self.num_batches
 
             if self.alpha_scheduler:
-                self.scheduled_alpha = 2.0 / (1.0 + np.exp(-10 * p)) - 1
+                self.scheduled_alpha = float(
+                    self._alpha_schedule[min(step,
+                                             len(self._alpha_schedule) - 1)])
 
             if self.lr_scheduler:
+                p = step / (self.non_warmup_epochs * self.num_batches)
                 self.lr_factor = 1.0 / ((1.0 + self.lr_scheduler_gamma * p)**
                                         self.lr_scheduler_decay)
 
+    def optimizer_zero_grad(self, epoch, batch_idx, optimizer,
+                            optimizer_idx=0):
+        # dropping the gradient tensors skips the zero-fill pass over
+        # every parameter that zeroing them in place would cost
+        optimizer.zero_grad(set_to_none=True)
+
+    def _get_domain_labels(self, num_samples: int, device: torch.device,
+                           source: bool) -> torch.Tensor:
+        # reuse the constant domain labels across steps instead of
+        # allocating and filling fresh tensors every batch
+        buffer = self._source_domain_labels if source else self._target_domain_labels
+        if buffer is None or buffer.numel(
+        ) < num_samples or buffer.device != device:
+            if source:
+                buffer = torch.zeros(num_samples,
+                                     dtype=torch.long,
+                                     device=device)
+                self._source_domain_labels = buffer
+            else:
+                buffer = torch.ones(num_samples,
+                                    dtype=torch.long,
+                                    device=device)
+                self._target_domain_labels = buffer
+        return buffer[:num_samples]
+
     def _domain_loss_fn(self, x_source_feat: torch.Tensor,
                         x_target_feat: torch.Tensor) -> torch.Tensor:
         raise NotImplementedError
@@ -155,69 +220,81 @@ class _DANNLikeTrainer(ClassifierTrainer):
                       batch_idx: int) -> torch.Tensor:
         (x_source, y_source), (x_target, _) = batch
 
-        x_source_feat = self.extractor(x_source)
+        # run the extractor and the domain classifier once on the
+        # concatenated source and target batches instead of once per
+        # domain, halving kernel launches for the same FLOPs
+        x_cat = torch.cat([x_source, x_target], dim=0)
+        x_cat_feat = self.extractor(x_cat)
+        x_source_feat = x_cat_feat[:len(x_source)]
         y_source_pred = self.classifier(x_source_feat)
-        x_target_feat = self.extractor(x_target)
-
-        x_source_feat_r = GradientReverse.apply(x_source_feat,
-                                                self.scheduled_alpha)
-        y_source_disc = self.domain_classifier(x_source_feat_r)
 
-        x_target_feat_r = GradientReverse.apply(x_target_feat,
-                                                self.scheduled_alpha)
-        y_target_disc = self.domain_classifier(x_target_feat_r)
+        x_cat_feat_r = GradientReverse.apply(x_cat_feat, self.scheduled_alpha)
+        y_disc = self.domain_classifier(x_cat_feat_r)
 
         task_loss = self.ce_fn(y_source_pred, y_source)
-        domain_loss = self.ce_fn(
-            y_source_disc,
-            torch.zeros(len(y_source_disc),
-                        dtype=torch.long,
-                        device=x_source.device)) + self.ce_fn(
-                            y_target_disc,
-                            torch.ones(len(y_target_disc),
-                                       dtype=torch.long,
-                                       device=x_target.device))
+        source_domain_labels = self._get_domain_labels(
+            len(x_source), x_source.device, source=True)
+        target_domain_labels = self._get_domain_labels(
+            len(x_target), x_target.device, source=False)
+        # a single cross-entropy call over the concatenated logits
+        # launches one softmax + NLL kernel instead of two; the per-domain
+        # means are recovered from the unreduced losses to preserve the
+        # original mean-then-add semantics
+        domain_losses = self.domain_ce_fn(
+            y_disc,
+            torch.cat([source_domain_labels, target_domain_labels], dim=0))
+        domain_loss = domain_losses[:len(x_source)].mean(
+        ) + domain_losses[len(x_source):].mean()
 
         if self.current_epoch >= self.warmup_epochs:
             loss = task_loss + self.weight_domain * domain_loss
         else:
             loss = task_loss
 
+        # accumulate only; the metrics are computed and logged once per
+        # epoch in on_train_epoch_end, avoiding a metric forward and the
+        # associated device sync on every step
+        domain_loss_value = domain_loss.detach()
+        task_loss_value = task_loss.detach()
+        if self._train_loss_count == 0:
+            self._train_domain_loss_sum = domain_loss_value.clone()
+            self._train_task_loss_sum = task_loss_value.clone()
+        else:
+            self._train_domain_loss_sum += domain_loss_value
+            self._train_task_loss_sum += task_loss_value
+        self._train_loss_count += 1
+
+        self.train_metrics.update(y_source_pred, y_source)
+
         self.log("train_domain_loss",
-                 self.train_domain_loss(loss),
+                 domain_loss,
                  prog_bar=True,
                  on_epoch=False,
                  logger=False,
                  on_step=True)
         self.log("train_task_loss",
-                 self.train_task_loss(loss),
+                 task_loss,
                  prog_bar=True,
                  on_epoch=False,
                  logger=False,
                  on_step=True)
-        for i, metric_value in enumerate(self.train_metrics.values()):
-            self.log(f"train_{self.metrics[i]}",
-                     metric_value(y_source_pred, y_source),
-                     prog_bar=True,
-                     on_epoch=False,
-                     logger=False,
-                     on_step=True)
 
         return loss
 
     def on_train_epoch_end(self) -> None:
-        self.log("train_domain_loss",
-                 self.train_domain_loss.compute(),
-                 prog_bar=False,
-                 on_epoch=True,
-                 on_step=False,
-                 logger=True)
-        self.log("train_task_loss",
-                 self.train_task_loss.compute(),
-                 prog_bar=False,
-                 on_epoch=True,
-                 on_step=False,
-                 logger=True)
+        if self._train_loss_count > 0:
+            self.log("train_domain_loss",
+                     self._train_domain_loss_sum / self._train_loss_count,
+                     prog_bar=False,
+                     on_epoch=True,
+                     on_step=False,
+                     logger=True)
+            self.log("train_task_loss",
+                     self._train_task_loss_sum / self._train_loss_count,
+                     prog_bar=False,
+                     on_epoch=True,
+                     on_step=False,
+                     logger=True)
         for i, metric_value in enumerate(self.train_metrics.values()):
             self.log(f"train_{self.metrics[i]}",
                      metric_value.compute(),
@@ -234,8 +311,7 @@ class _DANNLikeTrainer(ClassifierTrainer):
         log.info(str + '\n')
 
         # reset the metrics
-        self.train_domain_loss.reset()
-        self.train_task_loss.reset()
+        self._train_loss_count = 0
         self.train_metrics.reset()
 
     def forward(self, x: torch.Tensor) -> torch.Tensor:
@@ -244,11 +320,25 @@ class _DANNLikeTrainer(ClassifierTrainer):
         return x
 
     def configure_optimizers(self):
-        optimizer = torch.optim.Adam(chain(self.extractor.parameters(),
-                                           self.classifier.parameters(),
-                                           self.domain_classifier.parameters()),
-                                     lr=self.lr,
-                                     weight_decay=self.weight_decay)
+        params = list(
+            chain(self.extractor.parameters(), self.classifier.parameters(),
+                  self.domain_classifier.parameters()))
+        # batch the per-parameter Adam updates into a single fused kernel
+        # on CUDA, or multi-tensor (foreach) kernels elsewhere
+        if self.device.type == 'cuda':
+            impl_kwargs = {'fused': True}
+        else:
+            impl_kwargs = {'foreach': True}
+        try:
+            optimizer = torch.optim.Adam(params,
+                                         lr=self.lr,
+                                         weight_decay=self.weight_decay,
+                                         **impl_kwargs)
+        except (TypeError, RuntimeError):
+            # older torch versions without fused/foreach Adam
+            optimizer = torch.optim.Adam(params,
+                                         lr=self.lr,
+                                         weight_decay=self.weight_decay)
         if self.lr_scheduler:
             scheduler = torch.optim.lr_scheduler.LambdaLR(
                 optimizer, lr_lambda=lambda epoch: self.lr_factor)